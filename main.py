@@ -9,16 +9,75 @@ Usage:
 - rolls A B: Random number from A to B (inclusive)
 """
 
-import json
 import sys
-import random
-from pathlib import Path
+from os import urandom
+
+# json is imported lazily: Flow Launcher starts a fresh interpreter per
+# query, so every module imported up front is paid for on each keystroke.
+
+
+def _json_codec():
+    """Import json and return (loads, dumps, JSONDecodeError)
+
+    dumps returns UTF-8 encoded bytes ready to be written to stdout.
+    """
+    import json
+
+    def dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode()
+
+    return json.loads, dumps, json.JSONDecodeError
+
+
+# Query response for a single result with exactly RandomRollPlugin._RESULT_TEMPLATE's
+# keys; main() fills in the JSON-encoded values and checks the keys first
+_QUERY_RESPONSE = b'{"result":[{"Title":%s,"SubTitle":%s,"IcoPath":%s}]}\n'
+
+
+def _randbelow(n):
+    """Return a uniformly distributed int in [0, n) drawn from os.urandom
+
+    Reading just the bytes needed avoids importing random and seeding its
+    Mersenne Twister state for the single number each process draws.
+    """
+    k = (n - 1).bit_length()
+    nbytes = (k + 7) // 8
+    mask = (1 << k) - 1
+    while True:
+        r = int.from_bytes(urandom(nbytes), "little") & mask
+        if r < n:
+            return r
+
+
+def _maybe_int(s):
+    """Return False if s cannot be an integer, so int() can be skipped for labels
+
+    Only the optional sign and first digit are checked; int() still has the
+    final say (digit separators, overly long strings, trailing letters).
+    """
+    if s[:1] in ("-", "+"):
+        s = s[1:]
+    return s[:1].isdecimal()
+
 
 class RandomRollPlugin:
+    # Fields shared by every result; copied and filled in by _result()
+    _RESULT_TEMPLATE = {"Title": "", "SubTitle": "", "IcoPath": "icon.png"}
+
+    _USAGE_TITLE = "Random Roll Usage"
+    _USAGE_SUBTITLE = "\n".join([
+        "* roll: Random based on default type (yes/no, number, or custom label)",
+        "* roll N: Random number 1 to N",
+        "* roll A B: Random number A to B",
+        "* roll X Y Z...: Random choice from custom labels"
+    ])
+    _USAGE_RESULT = [{"Title": _USAGE_TITLE, "SubTitle": _USAGE_SUBTITLE, "IcoPath": "icon.png"}]
+
     def __init__(self, settings=None):
-        self.plugin_dir = Path(__file__).parent
         # Settings will be passed from Flow Launcher
         self.settings = settings if settings is not None else {}
+        # Query handlers indexed by argument count (3+ args are custom labels)
+        self._dispatch = (self._handle_empty, self._handle_one, self._handle_two)
     
     def update_settings(self, settings):
         """Update settings with values from Flow Launcher"""
@@ -27,60 +86,74 @@ class RandomRollPlugin:
 
     def handle_query(self, query):
         """Handle a query from Flow Launcher"""
-        parts = query.strip().split()
-
-        if not parts:
-            # No arguments: use default roll type
-            roll_type = self.settings.get("Default Roll Type", "Number")
-            if roll_type == "Yes/No":
-                return self.roll_yes_no()
-            elif roll_type == "CustomLabel":
-                return self.roll_custom_label()
-            else:
-                # Default to Number roll with configured from/to values
-                try:
-                    from_val = int(self.settings.get("default_from", 1))
-                    to_val = int(self.settings.get("default_to", 6))
-                except (ValueError, TypeError):
-                    from_val = 1
-                    to_val = 6
-                return self.roll_range(from_val, to_val)
-
-        if len(parts) == 1:
-            # One argument: try to roll from 1 to N
+        parts = query.split()
+        n = len(parts)
+        if n < 3:
+            return self._dispatch[n](parts)
+
+        # Multiple arguments: treat as custom labels
+        return self.roll_custom_label_from_args(parts)
+
+    def _handle_empty(self, parts):
+        """No arguments: use default roll type"""
+        # Settings are only read here and in the rolls that use them, since
+        # numeric and label queries never need them
+        settings = self.settings
+        roll_type = settings.get("Default Roll Type", "Number")
+        if roll_type == "Yes/No":
+            return self.roll_yes_no()
+        elif roll_type == "CustomLabel":
+            return self.roll_custom_label()
+        else:
+            # Default to Number roll with configured from/to values
+            try:
+                from_val = int(settings.get("default_from", 1))
+                to_val = int(settings.get("default_to", 6))
+            except (ValueError, TypeError):
+                from_val = 1
+                to_val = 6
+            return self.roll_range(from_val, to_val)
+
+    def _handle_one(self, parts):
+        """One argument: try to roll from 1 to N"""
+        if _maybe_int(parts[0]):
             try:
                 to_val = int(parts[0])
                 return self.roll_range(1, to_val)
             except ValueError:
-                # Not a number, treat as single custom label (not very useful, but handle it)
-                return self.roll_custom_label_from_args(parts)
+                pass
+        # Not a number, treat as single custom label (not very useful, but handle it)
+        return self.roll_custom_label_from_args(parts)
 
-        if len(parts) == 2:
-            # Two arguments: try to roll from A to B
+    def _handle_two(self, parts):
+        """Two arguments: try to roll from A to B"""
+        if _maybe_int(parts[0]) and _maybe_int(parts[1]):
             try:
                 a_val = int(parts[0])
                 b_val = int(parts[1])
                 return self.roll_range(a_val, b_val)
             except ValueError:
-                # Not valid numbers, treat as custom labels
-                return self.roll_custom_label_from_args(parts)
-
-        # Multiple arguments: treat as custom labels
+                pass
+        # Not valid numbers, treat as custom labels
         return self.roll_custom_label_from_args(parts)
 
+    def _result(self, title, subtitle):
+        """Build a single-item result list from the shared template"""
+        result = self._RESULT_TEMPLATE.copy()
+        result["Title"] = title
+        result["SubTitle"] = subtitle
+        return [result]
+
     def roll_yes_no(self):
         """Generate a random yes/no result"""
-        result = random.choice([True, False])
+        # One random bit; no rejection loop needed for a power of two
+        result = urandom(1)[0] & 1
         yes_label = self.settings.get("yes_label", "Yes")
         no_label = self.settings.get("no_label", "No")
         title = yes_label if result else no_label
         subtitle = f"Random {yes_label}/{no_label} answer"
 
-        return [{
-            "Title": title,
-            "SubTitle": subtitle,
-            "IcoPath": "icon.png"
-        }]
+        return self._result(title, subtitle)
 
     def roll_custom_label(self):
         """Generate a random result from custom labels"""
@@ -94,84 +167,69 @@ class RandomRollPlugin:
         if not labels:
             return self.show_usage("No custom labels configured. Please set custom labels in settings.")
         
-        result = random.choice(labels)
+        result = labels[_randbelow(len(labels))]
         title = result
         subtitle = f"Random choice from: {', '.join(labels)}"
 
-        return [{
-            "Title": title,
-            "SubTitle": subtitle,
-            "IcoPath": "icon.png"
-        }]
+        return self._result(title, subtitle)
 
     def roll_custom_label_from_args(self, labels):
         """Generate a random result from provided custom labels"""
         if not labels:
             return self.show_usage("No labels provided.")
         
-        result = random.choice(labels)
+        result = labels[_randbelow(len(labels))]
         title = result
         subtitle = f"Random choice from: {', '.join(labels)}"
 
-        return [{
-            "Title": title,
-            "SubTitle": subtitle,
-            "IcoPath": "icon.png"
-        }]
+        return self._result(title, subtitle)
 
     def roll_range(self, from_val, to_val):
         """Generate a random number in the given range"""
         # Ensure from <= to
-        start = min(from_val, to_val)
-        end = max(from_val, to_val)
+        if from_val <= to_val:
+            start, end = from_val, to_val
+        else:
+            start, end = to_val, from_val
 
         # Safety check: prevent extremely large ranges
-        if abs(end - start) > 10_000_000:
+        span = end - start
+        if span > 10_000_000:
             return self.show_usage("Range too large. Maximum range size is 10,000,000.")
 
-        try:
-            result = random.randint(start, end)
-            title = str(result)
-            subtitle = f"Random number between {start} and {end}"
-
-            return [{
-                "Title": title,
-                "SubTitle": subtitle,
-                "IcoPath": "icon.png"
-            }]
-        except (ValueError, OverflowError):
-            return self.show_usage("Invalid range values.")
+        result = start + _randbelow(span + 1)
+        title = str(result)
+        subtitle = f"Random number between {start} and {end}"
+
+        return self._result(title, subtitle)
 
     def show_usage(self, error_msg=None):
         """Show usage instructions"""
-        title = "Random Roll Usage"
-        subtitle_parts = [
-            "* roll: Random based on default type (yes/no, number, or custom label)",
-            "* roll N: Random number 1 to N",
-            "* roll A B: Random number A to B",
-            "* roll X Y Z...: Random choice from custom labels"
-        ]
-
-        if error_msg:
-            subtitle = f"{error_msg}\n\n" + "\n".join(subtitle_parts)
-        else:
-            subtitle = "\n".join(subtitle_parts)
+        if not error_msg:
+            # Shared list is safe to reuse: it is serialized once and discarded
+            return self._USAGE_RESULT
+        return self._result(self._USAGE_TITLE, f"{error_msg}\n\n{self._USAGE_SUBTITLE}")
 
-        return [{
-            "Title": title,
-            "SubTitle": subtitle,
-            "IcoPath": "icon.png"
-        }]
 
 def main():
     """Main entry point for the plugin"""
     plugin = RandomRollPlugin()
+    # Write encoded bytes directly, skipping print's text layer and extra newline write
+    write = sys.stdout.buffer.write
 
     # Flow Launcher passes the JSON-RPC request via sys.argv[1]
     # not through stdin like traditional JSON-RPC
     if len(sys.argv) > 1:
+        raw = sys.argv[1]
+        # Requests are always JSON objects; reject anything else without
+        # importing json at all
+        if raw.lstrip()[:1] != "{":
+            write(b'{"error": "Invalid JSON request"}\n')
+            return
+
+        loads, dumps, JSONDecodeError = _json_codec()
         try:
-            request = json.loads(sys.argv[1])
+            request = loads(raw)
             method = request.get("method", "")
             parameters = request.get("parameters", [])
             settings = request.get("settings", {})
@@ -182,20 +240,27 @@ def main():
             if method == "query":
                 query = parameters[0] if parameters else ""
                 results = plugin.handle_query(query)
-                response = {"result": results}
+                if len(results) == 1 and results[0].keys() == RandomRollPlugin._RESULT_TEMPLATE.keys():
+                    # Known result shape: only the field values need encoding
+                    result = results[0]
+                    payload = _QUERY_RESPONSE % (
+                        dumps(result["Title"]), dumps(result["SubTitle"]), dumps(result["IcoPath"])
+                    )
+                else:
+                    payload = dumps({"result": results}) + b"\n"
             else:
-                response = {"error": f"Unknown method: {method}"}
+                payload = dumps({"error": f"Unknown method: {method}"}) + b"\n"
 
             # Send response to stdout
-            print(json.dumps(response, ensure_ascii=False))
+            write(payload)
 
-        except json.JSONDecodeError as e:
-            print(json.dumps({"error": f"Invalid JSON request: {str(e)}"}))
+        except JSONDecodeError as e:
+            write(dumps({"error": f"Invalid JSON request: {str(e)}"}) + b"\n")
         except Exception as e:
-            print(json.dumps({"error": str(e)}))
+            write(dumps({"error": str(e)}) + b"\n")
     else:
         # No arguments provided
-        print(json.dumps({"error": "No JSON-RPC request provided"}))
+        write(b'{"error": "No JSON-RPC request provided"}\n')
 
 
 if __name__ == "__main__":